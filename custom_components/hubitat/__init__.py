@@ -65,8 +65,6 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
-    async_remove_services(hass, config_entry)
-
     unload_ok = all(
         await gather(
             *[
@@ -85,6 +83,11 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     _LOGGER.debug(f"Unloaded all components for {config_entry.entry_id}")
 
     if unload_ok:
-        cast(dict[str, Any], hass.data[DOMAIN]).pop(config_entry.entry_id)
+        hubs = cast(dict[str, Any], hass.data[DOMAIN])
+        _ = hubs.pop(config_entry.entry_id)
+
+        # Services are shared by all hubs; remove them with the last one
+        if len(hubs) == 0:
+            async_remove_services(hass, config_entry)
 
     return unload_ok
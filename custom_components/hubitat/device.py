@@ -56,46 +56,53 @@ class HubitatBase(Removable):
     @callback
     def get_attr(self, attr: DeviceAttribute) -> float | int | str | datetime | None:
         """Get the current value of an attribute."""
-        if attr in self._device.attributes:
-            return self._device.attributes[attr].value
+        attribute = self._device.attributes.get(attr)
+        if attribute is not None:
+            return attribute.value
         return None
 
     @callback
     def get_attr_unit(self, attr: DeviceAttribute) -> str | None:
         """Get the unit of an attribute."""
-        if attr in self._device.attributes:
-            return self._device.attributes[attr].unit
+        attribute = self._device.attributes.get(attr)
+        if attribute is not None:
+            return attribute.unit
         return None
 
     @callback
     def get_float_attr(self, attr: DeviceAttribute) -> float | None:
         """Get the current value of an attribute as a float."""
-        if attr in self._device.attributes:
-            return self._device.attributes[attr].float_value
+        attribute = self._device.attributes.get(attr)
+        if attribute is not None:
+            return attribute.float_value
 
     @callback
     def get_int_attr(self, attr: DeviceAttribute) -> int | None:
         """Get the current value of an attribute as an int."""
-        if attr in self._device.attributes:
-            return self._device.attributes[attr].int_value
+        attribute = self._device.attributes.get(attr)
+        if attribute is not None:
+            return attribute.int_value
 
     @callback
     def get_list_attr(self, attr: DeviceAttribute) -> list[Any] | None:
         """Get the current value of an attribute as a list."""
-        if attr in self._device.attributes:
-            return self._device.attributes[attr].list_value
+        attribute = self._device.attributes.get(attr)
+        if attribute is not None:
+            return attribute.list_value
 
     @callback
     def get_dict_attr(self, attr: DeviceAttribute) -> dict[str, Any] | None:
         """Get the current value of an attribute as a dict."""
-        if attr in self._device.attributes:
-            return self._device.attributes[attr].dict_value
+        attribute = self._device.attributes.get(attr)
+        if attribute is not None:
+            return attribute.dict_value
 
     @callback
     def get_str_attr(self, attr: DeviceAttribute) -> str | None:
         """Get the current value of an attribute as a string."""
-        if attr in self._device.attributes:
-            return self._device.attributes[attr].str_value
+        attribute = self._device.attributes.get(attr)
+        if attribute is not None:
+            return attribute.str_value
 
 
 class HubitatEntityArgs(TypedDict):
@@ -268,6 +268,6 @@ def get_lock_codes(device: Device) -> list[str]:
         codes_str = cast(str, device.attributes[DeviceAttribute.LOCK_CODES].value)
         codes = loads(codes_str)
         return [codes[id]["name"] for id in codes]
-    except Exception as e:
-        _LOGGER.warn("Error getting lock codes for %s: %s", device, e)
+    except (KeyError, TypeError, ValueError) as e:
+        _LOGGER.warning("Error getting lock codes for %s: %s", device, e)
         return []
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from logging import getLogger
 from typing import Callable, TypeVar
 
@@ -27,13 +28,11 @@ def create_and_add_entities(
 ) -> list[E]:
     """Create entites and add them to the entity registry."""
     hub = get_hub(hass, config_entry.entry_id)
-    devices = hub.devices
+    devices = hub.devices.values()
     overrides = get_device_overrides(config_entry)
 
     # Devices that have this entity type
-    devices_with_entity = [
-        devices[id] for id in devices if is_type(devices[id], overrides)
-    ]
+    devices_with_entity = [d for d in devices if is_type(d, overrides)]
 
     entities: list[E] = [
         EntityClass(hub=hub, device=device) for device in devices_with_entity
@@ -44,9 +43,7 @@ def create_and_add_entities(
         async_add_entities(entities)
 
     # Devices that have this entity type when not overridden
-    original_devices_with_entity = [
-        devices[id] for id in devices if is_type(devices[id], None)
-    ]
+    original_devices_with_entity = [d for d in devices if is_type(d, None)]
 
     # Remove any existing entities that were overridden
     entity_unique_ids_to_remove = [
@@ -55,18 +52,69 @@ def create_and_add_entities(
         if d not in devices_with_entity
     ]
 
-    if len(entity_unique_ids_to_remove) > 0:
-        _LOGGER.debug(f"Removing overridden {platform} entities...")
-        ereg = entity_registry.async_get(hass)
-        entity_ids = {ereg.entities[id].unique_id: id for id in ereg.entities}
-        for unique_id in entity_ids:
-            if unique_id in entity_unique_ids_to_remove:
-                ereg.async_remove(entity_ids[unique_id])
-                _LOGGER.debug(f"Removed overridden entity {entity_ids[unique_id]}")
+    _remove_overridden_entities(hass, platform, entity_unique_ids_to_remove)
 
     return entities
 
 
+def create_and_add_entities_by_type(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    platform: Platform,
+    get_types: Callable[[Device, dict[str, str] | None], Sequence[type[E]]],
+) -> list[E]:
+    """
+    Create entites of several types in a single pass over the hub's devices
+    and add them to the entity registry.
+
+    get_types returns the entity classes a device should have, given the
+    device type overrides (or None for a device's default types).
+    """
+    hub = get_hub(hass, config_entry.entry_id)
+    overrides = get_device_overrides(config_entry)
+
+    entities: list[E] = []
+    entity_unique_ids_to_remove: list[str | None] = []
+
+    for device in hub.devices.values():
+        types = get_types(device, overrides)
+        entities.extend(EntityClass(hub=hub, device=device) for EntityClass in types)
+
+        # Remove any existing entities that were overridden; a device's types
+        # can only differ from its defaults if it has an override
+        if device.id in overrides:
+            entity_unique_ids_to_remove.extend(
+                EntityClass(hub=hub, device=device, temp=True).unique_id
+                for EntityClass in get_types(device, None)
+                if EntityClass not in types
+            )
+
+    if len(entities) > 0:
+        hub.add_entities(entities)
+        async_add_entities(entities)
+
+    _remove_overridden_entities(hass, platform, entity_unique_ids_to_remove)
+
+    return entities
+
+
+def _remove_overridden_entities(
+    hass: HomeAssistant, platform: Platform, unique_ids: list[str | None]
+) -> None:
+    """Remove registered entities that a device type override replaced."""
+    if len(unique_ids) == 0:
+        return
+
+    _LOGGER.debug(f"Removing overridden {platform} entities...")
+    ereg = entity_registry.async_get(hass)
+    entity_ids = {ereg.entities[id].unique_id: id for id in ereg.entities}
+    for unique_id in entity_ids:
+        if unique_id in unique_ids:
+            ereg.async_remove(entity_ids[unique_id])
+            _LOGGER.debug(f"Removed overridden entity {entity_ids[unique_id]}")
+
+
 def create_and_add_event_emitters(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -74,11 +122,10 @@ def create_and_add_event_emitters(
 ) -> list[HubitatEventEmitter]:
     """Create event emitters."""
     hub = get_hub(hass, config_entry.entry_id)
-    devices = hub.devices
     emitters = [
-        HubitatEventEmitter(hub=hub, device=devices[i])
-        for i in devices
-        if is_emitter(devices[i])
+        HubitatEventEmitter(hub=hub, device=device)
+        for device in hub.devices.values()
+        if is_emitter(device)
     ]
 
     for emitter in emitters:
@@ -1,6 +1,6 @@
 import os
 import ssl
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from logging import getLogger
 from ssl import SSLContext
 from types import MappingProxyType
@@ -106,6 +106,8 @@ class Hub:
         self.config_entry = entry
         self.token = cast(str, self.config_entry.data.get(CONF_ACCESS_TOKEN))
         self.entities: list[UpdateableEntity] = []
+        self._entities_by_device: dict[str, list[UpdateableEntity]] = {}
+        self._entities_by_id: dict[str, UpdateableEntity] = {}
         self.event_emitters: list[Removable] = []
 
         self._temperature_unit = (
@@ -229,6 +231,41 @@ class Hub:
     def add_entities(self, entities: list[E]) -> None:
         """Add entities to this hub."""
         self.entities.extend(entities)
+        for entity in entities:
+            self._entities_by_device.setdefault(entity.device_id, []).append(entity)
+
+    def get_device_entities(self, device_id: str) -> Sequence[UpdateableEntity]:
+        """Return the entities that have been added for a specific device."""
+        return self._entities_by_device.get(device_id, ())
+
+    def get_entity(self, entity_id: str) -> UpdateableEntity | None:
+        """Return the entity with the given entity ID, if this hub has it."""
+        entity = self.find_entity(entity_id)
+        if entity is not None:
+            return entity
+
+        self.refresh_entity_index()
+        return self.find_entity(entity_id)
+
+    def find_entity(self, entity_id: str) -> UpdateableEntity | None:
+        """
+        Return the entity with the given entity ID from the current index.
+
+        The index isn't rebuilt on a miss, so a recently added or renamed
+        entity may not be found until refresh_entity_index is called.
+        """
+        entity = self._entities_by_id.get(entity_id)
+        if entity is not None and entity.entity_id == entity_id:
+            return entity
+        return None
+
+    def refresh_entity_index(self) -> None:
+        """Rebuild the entity ID index."""
+        # HA assigns entity IDs when entities are added, and users can rename
+        # them, so the index can go stale
+        self._entities_by_id = {
+            entity.entity_id: entity for entity in self.entities if entity.entity_id
+        }
 
     def add_event_emitters(self, emitters: list[M]) -> None:
         """Add event emitters to this hub."""
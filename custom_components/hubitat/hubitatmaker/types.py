@@ -132,7 +132,7 @@ class Device:
         return self._attributes_ro
 
     @property
-    def capabilities(self) -> Sequence[str]:
+    def capabilities(self) -> frozenset[str]:
         return self._capabilities
 
     @property
@@ -156,10 +156,10 @@ class Device:
         for attr in properties.get("attributes", []):
             self._attributes[attr["name"]] = Attribute(attr)
 
-        caps: list[str] = [
+        # Capabilities are only ever tested for membership
+        self._capabilities: frozenset[str] = frozenset(
             p for p in properties.get("capabilities", []) if isinstance(p, str)
-        ]
-        self._capabilities: tuple[str, ...] = tuple(caps)
+        )
 
         commands: list[str] = [
             p for p in properties.get("commands", []) if isinstance(p, str)
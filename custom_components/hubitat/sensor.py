@@ -1,13 +1,16 @@
 """Hubitat sensor entities."""
 
 import re
+from collections.abc import Mapping
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from logging import getLogger
-from typing import TYPE_CHECKING, Unpack, override
+from types import MappingProxyType
+from typing import NamedTuple, Unpack, override
 
 from custom_components.hubitat.hubitatmaker.const import DeviceCapability
-from custom_components.hubitat.util import to_display_name
+from custom_components.hubitat.util import get_hub_device_id, to_display_name
 from homeassistant.components.sensor import (
     SensorEntity,
 )
@@ -35,35 +38,53 @@ from homeassistant.const import (
     UnitOfVolumetricFlux,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
+from .const import DOMAIN
 from .device import HubitatEntity, HubitatEntityArgs
-from .entities import create_and_add_entities
-from .hub import get_hub
-from .hubitatmaker import DeviceAttribute
+from .hub import Hub, get_hub
+from .hubitatmaker import DeviceAttribute, Event
 from .hubitatmaker.types import Device
 
 _LOGGER = getLogger(__name__)
 
-PRESSURE_UNITS: dict[str, UnitOfPressure] = {
-    "pa": UnitOfPressure.PA,
-    "hpa": UnitOfPressure.HPA,
-    "kpa": UnitOfPressure.KPA,
-    "bar": UnitOfPressure.BAR,
-    "cbar": UnitOfPressure.CBAR,
-    "mbar": UnitOfPressure.MBAR,
-    "mmhg": UnitOfPressure.MMHG,
-    "inhg": UnitOfPressure.INHG,
-    "psi": UnitOfPressure.PSI,
-}
+PRESSURE_UNITS: Mapping[str, UnitOfPressure] = MappingProxyType(
+    {
+        "pa": UnitOfPressure.PA,
+        "hpa": UnitOfPressure.HPA,
+        "kpa": UnitOfPressure.KPA,
+        "bar": UnitOfPressure.BAR,
+        "cbar": UnitOfPressure.CBAR,
+        "mbar": UnitOfPressure.MBAR,
+        "mmhg": UnitOfPressure.MMHG,
+        "inhg": UnitOfPressure.INHG,
+        "psi": UnitOfPressure.PSI,
+    }
+)
+
+# Some battery devices report values like "Battery 50%"
+_BATTERY_RE = re.compile(r"Battery (\d+(?:\.\d+)?)%")
+
+
+@lru_cache(maxsize=4096)
+def _titled(name: str) -> str:
+    """Return a title-cased name; device and attribute names repeat a lot."""
+    return name.title()
+
+
+@lru_cache(maxsize=256)
+def _attribute_title(attribute: str) -> str:
+    """Return the title-cased display form of an attribute name."""
+    return attribute.replace("_", " ").title()
 
 
 class HubitatSensor(HubitatEntity, SensorEntity):
     """A generic Hubitat sensor."""
 
     _attribute: DeviceAttribute
-    _enabled_default: bool | None = None
+    _device_attrs: tuple[DeviceAttribute, ...]
 
     def __init__(
         self,
@@ -73,7 +94,7 @@ class HubitatSensor(HubitatEntity, SensorEntity):
         unit: str | None = None,
         device_class: SensorDeviceClass | None = None,
         state_class: SensorStateClass | None = None,
-        enabled_default: bool | None = None,
+        enabled_default: bool = True,
         # TODO: load options from device
         options: list[str] | None = None,
         **kwargs: Unpack[HubitatEntityArgs],
@@ -82,23 +103,23 @@ class HubitatSensor(HubitatEntity, SensorEntity):
         HubitatEntity.__init__(self, **kwargs)
         SensorEntity.__init__(self)
 
-        attr_name = (
-            attribute_name
+        attr_title = (
+            _titled(attribute_name)
             if attribute_name is not None
-            else attribute.replace("_", " ")
+            else _attribute_title(attribute)
         )
 
         self._attribute = attribute
-        self._attr_name: str | None = (
-            f"{super(HubitatEntity, self).name} {attr_name}".title()
-        )
+        self._device_attrs = (attribute,)
+        # HubitatEntity names itself after the device label
+        self._attr_name: str | None = f"{_titled(self._device.label)} {attr_title}"
         self._attr_native_unit_of_measurement: str | None = unit
         self._attr_device_class: SensorDeviceClass | None = device_class  # pyright: ignore[reportIncompatibleVariableOverride]
         self._attr_state_class: SensorStateClass | str | None = state_class
-        self._attr_unique_id: str | None = f"{super().unique_id}::sensor::{attribute}"
-        self._attr_entity_registry_enabled_default: bool = (
-            enabled_default if enabled_default is not None else True
+        self._attr_unique_id: str | None = _get_unique_id(
+            self._hub, self._device, attribute
         )
+        self._attr_entity_registry_enabled_default: bool = enabled_default
 
         if options is not None:
             self._attr_options: list[str] | None = options
@@ -115,7 +136,29 @@ class HubitatSensor(HubitatEntity, SensorEntity):
     @override
     def device_attrs(self) -> tuple[DeviceAttribute, ...] | None:
         """Return this entity's associated attributes"""
-        return (self._attribute,)
+        return self._device_attrs
+
+    @override
+    def handle_event(self, event: Event) -> None:
+        """
+        Handle a device event.
+
+        Devices send events for all of their attributes, so only tell HA about
+        the ones that actually changed this sensor's state.
+        """
+        if not self.enabled:
+            return
+
+        value = self._attr_native_value
+        unit = self._attr_native_unit_of_measurement
+        self.load_state()
+        if (
+            self._attr_native_value == value
+            and self._attr_native_unit_of_measurement == unit
+        ):
+            return
+
+        self.async_schedule_update_ha_state()
 
     def _get_native_value(self) -> StateType | date | datetime | Decimal:
         """Return this sensor's current value."""
@@ -125,23 +168,6 @@ class HubitatSensor(HubitatEntity, SensorEntity):
 class HubitatBatterySensor(HubitatSensor):
     """A battery sensor."""
 
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a battery sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.BATTERY,
-            unit=PERCENTAGE,
-            device_class=SensorDeviceClass.BATTERY,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-    @override
-    def load_state(self):
-        super().load_state()
-        self._attr_native_value: StateType | date | datetime | Decimal = (
-            self._get_native_value()
-        )
-
     @override
     def _get_native_value(self) -> StateType | date | datetime | Decimal:
         """Return this battery sensor's current value."""
@@ -152,108 +178,15 @@ class HubitatBatterySensor(HubitatSensor):
             except ValueError:
                 # Some devices don't follow the spec
                 # See https://github.com/jason0x43/hacs-hubitat/issues/252#issuecomment-1896327401
-                match = re.match(r"Battery (\d.*)%", value)
+                match = _BATTERY_RE.match(value)
                 if match:
                     value = float(match.group(1))
         return value
 
 
-class HubitatEnergySensor(HubitatSensor):
-    """A energy sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a energy sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.ENERGY,
-            unit=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
-            **kwargs,
-        )
-
-
-class HubitatEnergySourceSensor(HubitatSensor):
-    """A energy source sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a energy source sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.ENERGY_SOURCE,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatHumiditySensor(HubitatSensor):
-    """A humidity sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a humidity sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.HUMIDITY,
-            unit=PERCENTAGE,
-            device_class=SensorDeviceClass.HUMIDITY,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatIlluminanceSensor(HubitatSensor):
-    """An illuminance sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize an illuminance sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.ILLUMINANCE,
-            unit=LIGHT_LUX,
-            device_class=SensorDeviceClass.ILLUMINANCE,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatPowerSensor(HubitatSensor):
-    """A power sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a power sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.POWER,
-            unit=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatPowerSourceSensor(HubitatSensor):
-    """A power source sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a power source sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.POWER_SOURCE,
-            device_class=SensorDeviceClass.ENUM,
-            **kwargs,
-        )
-
-
 class HubitatTemperatureSensor(HubitatSensor):
     """A temperature sensor."""
 
-    def __init__(
-        self,
-        attribute: DeviceAttribute = DeviceAttribute.TEMPERATURE,
-        **kwargs: Unpack[HubitatEntityArgs],
-    ):
-        """Initialize a temperature sensor."""
-        super().__init__(
-            attribute=attribute,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
     @override
     def load_state(self):
         super().load_state()
@@ -262,53 +195,18 @@ class HubitatTemperatureSensor(HubitatSensor):
         )
 
     def _get_native_unit_of_measurement(self) -> str | None:
-        unit: UnitOfTemperature = self._hub.temperature_unit
         attr_unit: str | None = self.get_attr_unit(self._attribute)
-        if attr_unit is not None:
-            if "F" in attr_unit:
-                return UnitOfTemperature.FAHRENHEIT
-            return UnitOfTemperature.CELSIUS
-        return unit
-
-
-class HubitatDewPointSensor(HubitatTemperatureSensor):
-    """A dewpoint sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a dewpoint sensor."""
-        super().__init__(attribute=DeviceAttribute.DEW_POINT, **kwargs)
-
-
-class HubitatVoltageSensor(HubitatSensor):
-    """A voltage sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a voltage sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.VOLTAGE,
-            unit=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
+        if attr_unit is None:
+            return self._hub.temperature_unit
+        # Hubitat reports units like "°F", so this can't be an equality check
+        if "F" in attr_unit:
+            return UnitOfTemperature.FAHRENHEIT
+        return UnitOfTemperature.CELSIUS
 
 
 class HubitatPressureSensor(HubitatSensor):
     """A pressure sensor."""
 
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a pressure sensor."""
-        # Maker API does not expose pressure unit
-        # Override if necessary through customization.py
-        # https://www.home-assistant.io/docs/configuration/customizing-devices/
-        super().__init__(
-            attribute=DeviceAttribute.PRESSURE,
-            unit=UnitOfPressure.MBAR,
-            device_class=SensorDeviceClass.PRESSURE,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
     @override
     def load_state(self):
         super().load_state()
@@ -320,344 +218,14 @@ class HubitatPressureSensor(HubitatSensor):
         """Return this sensor's current value."""
         attr_unit = self.get_attr_unit(self._attribute)
         if attr_unit is not None:
-            lower_unit = attr_unit.lower()
-            if lower_unit in PRESSURE_UNITS:
-                _LOGGER.debug(f"Using Hubitat unit {attr_unit} for {self.unique_id}")
-                return PRESSURE_UNITS[lower_unit]
-        _LOGGER.debug(f"Using default unit mbar for {self.unique_id}")
+            unit = PRESSURE_UNITS.get(attr_unit.lower())
+            if unit is not None:
+                _LOGGER.debug("Using Hubitat unit %s for %s", attr_unit, self.unique_id)
+                return unit
+        _LOGGER.debug("Using default unit mbar for %s", self.unique_id)
         return UnitOfPressure.MBAR
 
 
-class HubitatCarbonDioxide(HubitatSensor):
-    """A CarbonDioxide sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a CarbonDioxide sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.CARBON_DIOXIDE,
-            unit=CONCENTRATION_PARTS_PER_MILLION,
-            device_class=SensorDeviceClass.CO2,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-# This attribute isn't from the Hubitat spec, but appears to be an air quality
-# enumeration. See https://github.com/jason0x43/hacs-hubitat/issues/117
-class HubitatCarbonDioxideLevel(HubitatSensor):
-    """A CarbonDioxideLevel sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a CarbonDioxideLevel sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.CARBON_DIOXIDE_LEVEL,
-            device_class=SensorDeviceClass.ENUM,
-            options=["Good", "Mediocre", "Harmful", "Risk"],
-            **kwargs,
-        )
-
-
-# TODO: is this a valid attribute?
-class HubitatCarbonMonoxideLevel(HubitatSensor):
-    """A CarbonMonoxideLevel sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a CarbonMonoxideLevel sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.CARBON_MONOXIDE_LEVEL,
-            unit=CONCENTRATION_PARTS_PER_MILLION,
-            device_class=SensorDeviceClass.CO,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatVOC(HubitatSensor):
-    """A VOC sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a VOC sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.VOC,
-            unit=CONCENTRATION_PARTS_PER_BILLION,
-            device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatVOCLevel(HubitatSensor):
-    """A VOC-Level sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a VOC-Level sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.VOC_LEVEL,
-            device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatHomeHealth(HubitatSensor):
-    """A HomeHealth sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a HomeHealth sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.HOME_HEALTH,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatCurrentSensor(HubitatSensor):
-    """A current sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a current sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.AMPERAGE,
-            unit=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatUVIndexSensor(HubitatSensor):
-    """A UV index sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a UV index sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.UV,
-            device_class=None,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatAqiSensor(HubitatSensor):
-    """An AQI sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize an AQI sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.AQI,
-            device_class=SensorDeviceClass.AQI,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatAirQualityIndexSensor(HubitatSensor):
-    """An airQualityIndex sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize an airQualityIndex sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.AIR_QUALITY_INDEX,
-            device_class=SensorDeviceClass.AQI,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatPm1Sensor(HubitatSensor):
-    """A PM1 sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a PM1 sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.PM1,
-            unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-            device_class=SensorDeviceClass.PM1,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatPm10Sensor(HubitatSensor):
-    """A PM10 sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a PM10 sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.PM10,
-            unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-            device_class=SensorDeviceClass.PM10,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatPm25Sensor(HubitatSensor):
-    """A PM2.5 sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a PM2.5 sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.PM25,
-            unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-            device_class=SensorDeviceClass.PM25,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatRainRateSensor(HubitatSensor):
-    """A rain rate sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a rain rate sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.RAIN_RATE,
-            unit=UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
-            device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatRainDailySensor(HubitatSensor):
-    """A rain daily sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a rain daily sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.RAIN_DAILY,
-            unit=(UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR),
-            device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatWindDirectionSensor(HubitatSensor):
-    """A wind direction sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a wind direction sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.WIND_DIRECTION,
-            unit=DEGREE,
-            device_class=SensorDeviceClass.WIND_SPEED,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatWindSpeedSensor(HubitatSensor):
-    """A wind speed sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a wind speed sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.WIND_SPEED,
-            unit=UnitOfSpeed.KILOMETERS_PER_HOUR,
-            device_class=SensorDeviceClass.WIND_SPEED,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatWindGustSensor(HubitatSensor):
-    """A wind gust sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a wind gust sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.WIND_GUST,
-            unit=UnitOfSpeed.KILOMETERS_PER_HOUR,
-            device_class=SensorDeviceClass.WIND_SPEED,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatRateSensor(HubitatSensor):
-    """A rate sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a rate sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.RATE,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatWaterDayPriceSensor(HubitatSensor):
-    """A water day liter price sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a water day liter price sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.DAY_EURO,
-            unit=CURRENCY_EURO,
-            device_class=SensorDeviceClass.MONETARY,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatWaterDayLiterSensor(HubitatSensor):
-    """A water day liter sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a water day liter sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.DAY_LITER,
-            unit=UnitOfVolume.LITERS,
-            device_class=SensorDeviceClass.WATER,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatWaterCumulativeLiterSensor(HubitatSensor):
-    """A water cumulative liter sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a water cumulative liter sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.CUMULATIVE_LITER,
-            unit=UnitOfVolume.LITERS,
-            device_class=SensorDeviceClass.WATER,
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            **kwargs,
-        )
-
-
-class HubitatWaterCumulativeM3Sensor(HubitatSensor):
-    """A water cumulative m3 sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a water cumulative m3 sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.CUMULATIVE_CUBIC_METER,
-            unit=UnitOfVolume.CUBIC_METERS,
-            device_class=SensorDeviceClass.WATER,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
-class HubitatWaterDayM3Sensor(HubitatSensor):
-    """A water day m3 sensor."""
-
-    def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
-        """Initialize a water day m3 sensor."""
-        super().__init__(
-            attribute=DeviceAttribute.DAY_CUBIC_METER,
-            unit=UnitOfVolume.CUBIC_METERS,
-            device_class=SensorDeviceClass.WATER,
-            state_class=SensorStateClass.MEASUREMENT,
-            **kwargs,
-        )
-
-
 class HubitatUpdateSensor(HubitatSensor):
     """
     A sensor that reports the last time a state update was received for a
@@ -704,50 +272,194 @@ class HubitatHubModeSensor(HubitatSensor):
         )
 
 
-_SENSOR_ATTRS: tuple[
-    tuple[DeviceAttribute, type[HubitatSensor], DeviceCapability | None], ...
-] = (
-    (DeviceAttribute.AIR_QUALITY_INDEX, HubitatAirQualityIndexSensor, None),
-    (DeviceAttribute.AMPERAGE, HubitatCurrentSensor, None),
-    (DeviceAttribute.AQI, HubitatAqiSensor, None),
-    (DeviceAttribute.BATTERY, HubitatBatterySensor, None),
-    (DeviceAttribute.CARBON_DIOXIDE, HubitatCarbonDioxide, None),
-    (DeviceAttribute.CARBON_DIOXIDE_LEVEL, HubitatCarbonDioxideLevel, None),
-    (DeviceAttribute.CARBON_MONOXIDE_LEVEL, HubitatCarbonMonoxideLevel, None),
-    (DeviceAttribute.CUMULATIVE_CUBIC_METER, HubitatWaterCumulativeM3Sensor, None),
-    (DeviceAttribute.CUMULATIVE_LITER, HubitatWaterCumulativeLiterSensor, None),
-    (DeviceAttribute.DAY_CUBIC_METER, HubitatWaterDayM3Sensor, None),
-    (DeviceAttribute.DAY_EURO, HubitatWaterDayPriceSensor, None),
-    (DeviceAttribute.DAY_LITER, HubitatWaterDayLiterSensor, None),
-    (DeviceAttribute.DEW_POINT, HubitatDewPointSensor, None),
-    (DeviceAttribute.ENERGY, HubitatEnergySensor, None),
-    (DeviceAttribute.ENERGY_SOURCE, HubitatEnergySourceSensor, None),
-    (DeviceAttribute.HOME_HEALTH, HubitatHomeHealth, None),
-    (DeviceAttribute.HUMIDITY, HubitatHumiditySensor, None),
-    (DeviceAttribute.ILLUMINANCE, HubitatIlluminanceSensor, None),
-    (DeviceAttribute.PM1, HubitatPm1Sensor, None),
-    (DeviceAttribute.PM10, HubitatPm10Sensor, None),
-    (DeviceAttribute.PM25, HubitatPm25Sensor, None),
-    (DeviceAttribute.POWER, HubitatPowerSensor, DeviceCapability.POWER_METER),
-    (DeviceAttribute.POWER_SOURCE, HubitatPowerSourceSensor, None),
-    (DeviceAttribute.PRESSURE, HubitatPressureSensor, None),
-    (DeviceAttribute.RAIN_DAILY, HubitatRainDailySensor, None),
-    (DeviceAttribute.RAIN_RATE, HubitatRainRateSensor, None),
-    (DeviceAttribute.RATE, HubitatRateSensor, None),
-    (DeviceAttribute.TEMPERATURE, HubitatTemperatureSensor, None),
-    (DeviceAttribute.UV, HubitatUVIndexSensor, None),
-    (DeviceAttribute.VOC, HubitatVOC, None),
-    (DeviceAttribute.VOC_LEVEL, HubitatVOCLevel, None),
-    (DeviceAttribute.VOLTAGE, HubitatVoltageSensor, None),
-    (DeviceAttribute.WIND_DIRECTION, HubitatWindDirectionSensor, None),
-    (DeviceAttribute.WIND_GUST, HubitatWindGustSensor, None),
-    (DeviceAttribute.WIND_SPEED, HubitatWindSpeedSensor, None),
-)
+class _SensorSpec(NamedTuple):
+    """How to build the sensor for a known device attribute."""
+
+    cls: type[HubitatSensor] = HubitatSensor
+    unit: str | None = None
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    options: list[str] | None = None
+    # A capability the device must have for the sensor to be created
+    capability: DeviceCapability | None = None
+
+
+_SENSOR_ATTRS: dict[DeviceAttribute, _SensorSpec] = {
+    DeviceAttribute.AIR_QUALITY_INDEX: _SensorSpec(
+        device_class=SensorDeviceClass.AQI, state_class=SensorStateClass.MEASUREMENT
+    ),
+    DeviceAttribute.AMPERAGE: _SensorSpec(
+        unit=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.AQI: _SensorSpec(
+        device_class=SensorDeviceClass.AQI, state_class=SensorStateClass.MEASUREMENT
+    ),
+    DeviceAttribute.BATTERY: _SensorSpec(
+        cls=HubitatBatterySensor,
+        unit=PERCENTAGE,
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.CARBON_DIOXIDE: _SensorSpec(
+        unit=CONCENTRATION_PARTS_PER_MILLION,
+        device_class=SensorDeviceClass.CO2,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    # This attribute isn't from the Hubitat spec, but appears to be an air
+    # quality enumeration. See https://github.com/jason0x43/hacs-hubitat/issues/117
+    DeviceAttribute.CARBON_DIOXIDE_LEVEL: _SensorSpec(
+        device_class=SensorDeviceClass.ENUM,
+        options=["Good", "Mediocre", "Harmful", "Risk"],
+    ),
+    # TODO: is this a valid attribute?
+    DeviceAttribute.CARBON_MONOXIDE_LEVEL: _SensorSpec(
+        unit=CONCENTRATION_PARTS_PER_MILLION,
+        device_class=SensorDeviceClass.CO,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.CUMULATIVE_CUBIC_METER: _SensorSpec(
+        unit=UnitOfVolume.CUBIC_METERS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.CUMULATIVE_LITER: _SensorSpec(
+        unit=UnitOfVolume.LITERS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    DeviceAttribute.DAY_CUBIC_METER: _SensorSpec(
+        unit=UnitOfVolume.CUBIC_METERS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.DAY_EURO: _SensorSpec(
+        unit=CURRENCY_EURO,
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.DAY_LITER: _SensorSpec(
+        unit=UnitOfVolume.LITERS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.DEW_POINT: _SensorSpec(
+        cls=HubitatTemperatureSensor,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.ENERGY: _SensorSpec(
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL,
+    ),
+    DeviceAttribute.ENERGY_SOURCE: _SensorSpec(
+        state_class=SensorStateClass.MEASUREMENT
+    ),
+    DeviceAttribute.HOME_HEALTH: _SensorSpec(state_class=SensorStateClass.MEASUREMENT),
+    DeviceAttribute.HUMIDITY: _SensorSpec(
+        unit=PERCENTAGE,
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.ILLUMINANCE: _SensorSpec(
+        unit=LIGHT_LUX,
+        device_class=SensorDeviceClass.ILLUMINANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.PM1: _SensorSpec(
+        unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+        device_class=SensorDeviceClass.PM1,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.PM10: _SensorSpec(
+        unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+        device_class=SensorDeviceClass.PM10,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.PM25: _SensorSpec(
+        unit=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+        device_class=SensorDeviceClass.PM25,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.POWER: _SensorSpec(
+        unit=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        capability=DeviceCapability.POWER_METER,
+    ),
+    DeviceAttribute.POWER_SOURCE: _SensorSpec(device_class=SensorDeviceClass.ENUM),
+    # Maker API does not expose pressure unit
+    # Override if necessary through customization.py
+    # https://www.home-assistant.io/docs/configuration/customizing-devices/
+    DeviceAttribute.PRESSURE: _SensorSpec(
+        cls=HubitatPressureSensor,
+        unit=UnitOfPressure.MBAR,
+        device_class=SensorDeviceClass.PRESSURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.RAIN_DAILY: _SensorSpec(
+        unit=UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+        device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.RAIN_RATE: _SensorSpec(
+        unit=UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+        device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.RATE: _SensorSpec(state_class=SensorStateClass.MEASUREMENT),
+    DeviceAttribute.TEMPERATURE: _SensorSpec(
+        cls=HubitatTemperatureSensor,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.UV: _SensorSpec(state_class=SensorStateClass.MEASUREMENT),
+    DeviceAttribute.VOC: _SensorSpec(
+        unit=CONCENTRATION_PARTS_PER_BILLION,
+        device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.VOC_LEVEL: _SensorSpec(
+        device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.VOLTAGE: _SensorSpec(
+        unit=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.WIND_DIRECTION: _SensorSpec(
+        unit=DEGREE,
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.WIND_GUST: _SensorSpec(
+        unit=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    DeviceAttribute.WIND_SPEED: _SensorSpec(
+        unit=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+}
+
 
+def _get_unique_id(hub: Hub, device: Device, attribute: DeviceAttribute) -> str:
+    """Return the unique ID of the sensor for a device attribute."""
+    return f"{get_hub_device_id(hub, device)}::sensor::{attribute}"
 
-def is_update_sensor(_device: Device, _overrides: dict[str, str] | None = None) -> bool:
-    """Every device can have an update sensor."""
-    return True
+
+def _is_disabled(ereg: entity_registry.EntityRegistry, unique_id: str) -> bool:
+    """Return True if a registered sensor has been disabled."""
+    entity_id = ereg.async_get_entity_id("sensor", DOMAIN, unique_id)
+    if entity_id is None:
+        return False
+    registry_entry = ereg.async_get(entity_id)
+    return registry_entry is not None and registry_entry.disabled
 
 
 async def async_setup_entry(
@@ -757,43 +469,50 @@ async def async_setup_entry(
 ) -> None:
     """Initialize sensor devices."""
 
-    add_hub_entities(hass, entry, async_add_entities)
-
-    # Add an update sensor for every device
-    _ = create_and_add_entities(
-        hass, entry, async_add_entities, "sensor", HubitatUpdateSensor, is_update_sensor
-    )
-
-    for attr in _SENSOR_ATTRS:
-        attr_name, Sensor, capability = attr
-
-        def is_sensor(device: Device, _overrides: dict[str, str] | None = None) -> bool:
-            if attr_name not in device.attributes:
-                return False
-            if capability is not None and capability not in device.capabilities:
-                return False
-            return True
-
-        _ = create_and_add_entities(
-            hass, entry, async_add_entities, "sensor", Sensor, is_sensor
-        )
-
-    # Create sensor entities for any attributes that don't correspond to known
-    # sensor types
-    unknown_entities: list[HubitatEntity] = []
     hub = get_hub(hass, entry.entry_id)
+    ereg = entity_registry.async_get(hass)
+
+    # Collect every sensor first so they can be added to HA in one batch
+    sensors: list[HubitatSensor] = create_hub_entities(hub, ereg)
+
+    for device_id, device in hub.devices.items():
+        # Attributes already handled by other platforms' entities; the last
+        # update attribute belongs to the update sensor, even when that sensor
+        # is skipped because it's disabled
+        used_device_attrs: set[str] = {DeviceAttribute.LAST_UPDATE}
+        for entity in hub.get_device_entities(device_id):
+            device_attrs = entity.device_attrs
+            if device_attrs:
+                used_device_attrs.update(device_attrs)
+
+        # Every device can have an update sensor. Update sensors are disabled
+        # by default, so don't create the ones that are still disabled in the
+        # registry; enabling one reloads the config entry.
+        update_id = _get_unique_id(hub, device, DeviceAttribute.LAST_UPDATE)
+        if not _is_disabled(ereg, update_id):
+            sensors.append(HubitatUpdateSensor(hub=hub, device=device))
 
-    for id in hub.devices:
-        device = hub.devices[id]
-        device_entities = [e for e in hub.entities if e.device_id == id]
-        used_device_attrs: set[str] = set()
-        for entity in device_entities:
-            if entity.device_attrs is not None:
-                for attr in entity.device_attrs:
-                    used_device_attrs.add(attr)
         for attr in device.attributes:
-            if attr not in used_device_attrs:
-                unknown_entities.append(
+            spec = _SENSOR_ATTRS.get(attr)
+            if spec is not None and (
+                spec.capability is None or spec.capability in device.capabilities
+            ):
+                # Add a sensor for every known sensor attribute
+                sensors.append(
+                    spec.cls(
+                        hub=hub,
+                        device=device,
+                        attribute=attr,
+                        unit=spec.unit,
+                        device_class=spec.device_class,
+                        state_class=spec.state_class,
+                        options=spec.options,
+                    )
+                )
+            elif attr not in used_device_attrs:
+                # Create generic sensors for any other attributes that aren't
+                # handled by another entity
+                sensors.append(
                     HubitatSensor(
                         hub=hub,
                         device=device,
@@ -803,41 +522,28 @@ async def async_setup_entry(
                         device_class=None,
                     )
                 )
-                _LOGGER.debug(f"Adding generic sensor for {device.id}:{attr}")
+                _LOGGER.debug("Adding generic sensor for %s:%s", device.id, attr)
 
-    if len(unknown_entities) > 0:
-        hub.add_entities(unknown_entities)
-        async_add_entities(unknown_entities)
-        for entity in unknown_entities:
-            entity.load_state()
+    if len(sensors) > 0:
+        hub.add_entities(sensors)
+        async_add_entities(sensors)
 
 
-def add_hub_entities(
-    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
-) -> None:
-    """Add entities for hub services."""
+def create_hub_entities(
+    hub: Hub, ereg: entity_registry.EntityRegistry
+) -> list[HubitatSensor]:
+    """Create entities for hub services that aren't disabled."""
 
-    hub_entities: list[HubitatEntity] = []
-    hub = get_hub(hass, entry.entry_id)
+    hub_entities: list[HubitatSensor] = []
 
-    if hub.hsm_supported:
+    if hub.hsm_supported and not _is_disabled(
+        ereg, _get_unique_id(hub, hub.device, DeviceAttribute.HSM_STATUS)
+    ):
         hub_entities.append(HubitatHsmSensor(hub=hub, device=hub.device))
 
-    if hub.mode_supported:
+    if hub.mode_supported and not _is_disabled(
+        ereg, _get_unique_id(hub, hub.device, DeviceAttribute.MODE)
+    ):
         hub_entities.append(HubitatHubModeSensor(hub=hub, device=hub.device))
 
-    if len(hub_entities) > 0:
-        hub.add_entities(hub_entities)
-        async_add_entities(hub_entities)
-        for entity in hub_entities:
-            entity.load_state()
-
-
-if TYPE_CHECKING:
-    from .hub import DEVICE_TYPECHECK, HUB_TYPECHECK
-
-    test_alarm = HubitatSensor(
-        hub=HUB_TYPECHECK,
-        device=DEVICE_TYPECHECK,
-        attribute=DeviceAttribute.MODE,
-    )
+    return hub_entities
@@ -1,6 +1,9 @@
-import json
+from asyncio import gather
+from collections.abc import Callable, Coroutine, Iterable, Mapping
+from functools import partial
 from logging import getLogger
-from typing import cast
+from types import MappingProxyType
+from typing import Any, cast
 
 import voluptuous as vol
 
@@ -14,7 +17,7 @@ from homeassistant.core import (
     SupportsResponse,
 )
 from homeassistant.helpers import config_validation as cv
-from homeassistant.util.json import JsonValueType
+from homeassistant.util.json import JsonValueType, json_loads
 
 from .alarm_control_panel import HubitatSecurityKeypad
 from .const import (
@@ -69,148 +72,180 @@ SET_HUB_MODE_SCHEMA = vol.Schema(
 )
 
 
+def _get_entity(hubs: Mapping[str, Hub], service: ServiceCall) -> HubitatEntity:
+    entity_id = cast(str, service.data.get(ATTR_ENTITY_ID))
+
+    # Check every hub's current index before rebuilding any of them
+    for hub in hubs.values():
+        entity = hub.find_entity(entity_id)
+        if entity is not None:
+            return cast(HubitatEntity, entity)
+
+    for hub in hubs.values():
+        hub.refresh_entity_index()
+        entity = hub.find_entity(entity_id)
+        if entity is not None:
+            return cast(HubitatEntity, entity)
+
+    raise ValueError(f"Invalid or unknown entity '{entity_id}'")
+
+
+def _get_target_hubs(hubs: Mapping[str, Hub], service: ServiceCall) -> Iterable[Hub]:
+    """
+    Return the target hubs for a service call.
+
+    If ATTR_HUB is specified, return the hub with that ID. Otherwise,
+    return all the hubs.
+    """
+    if ATTR_HUB in service.data:
+        targets: list[Hub] = []
+        hub_id = cast(str, service.data.get(ATTR_HUB)).lower()
+        for hub in hubs.values():
+            if hub.id == hub_id:
+                targets.append(hub)
+        if len(targets) == 0:
+            _LOGGER.error("Could not find a hub with ID %s", hub_id)
+        return targets
+
+    return hubs.values()
+
+
+async def _clear_code(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    entity = cast(HubitatLock | HubitatSecurityKeypad, _get_entity(hubs, service))
+    pos = cast(int, service.data.get(ATTR_POSITION))
+    await entity.clear_code(pos)
+
+
+async def _get_codes(hubs: Mapping[str, Hub], service: ServiceCall) -> ServiceResponse:
+    entity = _get_entity(hubs, service)
+    codes_str = entity.get_str_attr(DeviceAttribute.LOCK_CODES)
+    code_list = []
+    if codes_str:
+        try:
+            codes = cast(dict[str, dict[str, JsonValueType]], json_loads(codes_str))
+        except ValueError:
+            _LOGGER.error("json doc not decodable: %s", codes_str)
+            return {HassStateAttribute.CODES: []}
+        code_list = cast(
+            JsonValueType,
+            [{ATTR_POSITION: key, **codes[key]} for key in sorted(codes, key=int)],
+        )
+    return {HassStateAttribute.CODES: code_list}
+
+
+async def _send_command(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    entity = _get_entity(hubs, service)
+    cmd = cast(str, service.data.get(ATTR_COMMAND))
+    args = cast(list[str] | str | None, service.data.get(ATTR_ARGUMENTS))
+    if args is None:
+        await entity.send_command(cmd)
+    elif isinstance(args, list):
+        await entity.send_command(cmd, *args)
+    else:
+        await entity.send_command(cmd, args)
+
+
+async def _set_code(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    entity = cast(HubitatLock | HubitatSecurityKeypad, _get_entity(hubs, service))
+    pos = cast(int, service.data.get(ATTR_POSITION))
+    code = cast(str, service.data.get(ATTR_CODE))
+    name = cast(str, service.data.get(ATTR_NAME))
+    await entity.set_code(pos, code, name)
+
+
+async def _set_code_length(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    entity = cast(HubitatLock | HubitatSecurityKeypad, _get_entity(hubs, service))
+    length = cast(int, service.data.get(ATTR_LENGTH))
+    await entity.set_code_length(length)
+
+
+async def _set_entry_delay(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    entity = cast(HubitatSecurityKeypad, _get_entity(hubs, service))
+    delay = cast(int, service.data.get(ATTR_DELAY))
+    await entity.set_entry_delay(delay)
+
+
+async def _set_exit_delay(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    entity = cast(HubitatSecurityKeypad, _get_entity(hubs, service))
+    delay = cast(int, service.data.get(ATTR_DELAY))
+    await entity.set_exit_delay(delay)
+
+
+async def _set_hsm(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    command = cast(str, service.data.get(ATTR_COMMAND))
+    await gather(*(hub.set_hsm(command) for hub in _get_target_hubs(hubs, service)))
+
+
+async def _set_hub_mode(hubs: Mapping[str, Hub], service: ServiceCall) -> None:
+    mode = cast(str, service.data.get(ATTR_MODE))
+    await gather(*(hub.set_mode(mode) for hub in _get_target_hubs(hubs, service)))
+
+
+_ServiceHandler = Callable[
+    [Mapping[str, Hub], ServiceCall], Coroutine[Any, Any, ServiceResponse]
+]
+
+# The schema, handler, and response support of every service registered by
+# this module
+_SERVICES: Mapping[
+    ServiceName, tuple[vol.Schema, _ServiceHandler, SupportsResponse]
+] = MappingProxyType(
+    {
+        ServiceName.CLEAR_CODE: (CLEAR_CODE_SCHEMA, _clear_code, SupportsResponse.NONE),
+        ServiceName.GET_CODES: (GET_CODES_SCHEMA, _get_codes, SupportsResponse.ONLY),
+        ServiceName.SEND_COMMAND: (
+            SEND_COMMAND_SCHEMA,
+            _send_command,
+            SupportsResponse.NONE,
+        ),
+        ServiceName.SET_CODE: (SET_CODE_SCHEMA, _set_code, SupportsResponse.NONE),
+        ServiceName.SET_CODE_LENGTH: (
+            SET_CODE_LENGTH_SCHEMA,
+            _set_code_length,
+            SupportsResponse.NONE,
+        ),
+        ServiceName.SET_ENTRY_DELAY: (
+            SET_DELAY_SCHEMA,
+            _set_entry_delay,
+            SupportsResponse.NONE,
+        ),
+        ServiceName.SET_EXIT_DELAY: (
+            SET_DELAY_SCHEMA,
+            _set_exit_delay,
+            SupportsResponse.NONE,
+        ),
+        ServiceName.SET_HSM: (SET_HSM_SCHEMA, _set_hsm, SupportsResponse.NONE),
+        ServiceName.SET_HUB_MODE: (
+            SET_HUB_MODE_SCHEMA,
+            _set_hub_mode,
+            SupportsResponse.NONE,
+        ),
+    }
+)
+
+
 def async_register_services(
     hass: HomeAssistant,
     entry: ConfigEntry,
 ) -> None:
-    def get_entity(service: ServiceCall) -> HubitatEntity:
-        entity_id = cast(str, service.data.get(ATTR_ENTITY_ID))
-        hubs = cast(list[Hub], hass.data[DOMAIN].values())
-        for hub in hubs:
-            for entity in hub.entities:
-                if entity.entity_id == entity_id:
-                    return cast(HubitatEntity, entity)
-        raise ValueError(f"Invalid or unknown entity '{entity_id}'")
-
-    async def clear_code(service: ServiceCall) -> None:
-        entity = cast(HubitatLock | HubitatSecurityKeypad, get_entity(service))
-        pos = cast(int, service.data.get(ATTR_POSITION))
-        await entity.clear_code(pos)
-
-    async def get_codes(service: ServiceCall) -> ServiceResponse:
-        entity = get_entity(service)
-        codes_str = entity.get_str_attr(DeviceAttribute.LOCK_CODES)
-        code_list = []
-        if codes_str:
-            try:
-                codes = json.loads(codes_str)
-            except json.JSONDecodeError:
-                _LOGGER.error("json doc not decodable: %s", codes_str)
-                return {HassStateAttribute.CODES: []}
-            code_list = cast(
-                JsonValueType,
-                sorted(
-                    [{ATTR_POSITION: key, **value} for key, value in codes.items()],
-                    key=lambda x: int(x[ATTR_POSITION]),
-                ),
-            )
-        return {HassStateAttribute.CODES: code_list}
-
-    async def send_command(service: ServiceCall) -> None:
-        entity = get_entity(service)
-        cmd = cast(str, service.data.get(ATTR_COMMAND))
-        args = cast(str, service.data.get(ATTR_ARGUMENTS))
-        if args is not None:
-            if not isinstance(args, list):
-                args = [args]
-            await entity.send_command(cmd, *args)
-        else:
-            await entity.send_command(cmd)
-
-    async def set_code(service: ServiceCall) -> None:
-        entity = cast(HubitatLock | HubitatSecurityKeypad, get_entity(service))
-        pos = cast(int, service.data.get(ATTR_POSITION))
-        code = cast(str, service.data.get(ATTR_CODE))
-        name = cast(str, service.data.get(ATTR_NAME))
-        await entity.set_code(pos, code, name)
-
-    async def set_code_length(service: ServiceCall) -> None:
-        entity = cast(HubitatLock | HubitatSecurityKeypad, get_entity(service))
-        length = cast(int, service.data.get(ATTR_LENGTH))
-        await entity.set_code_length(length)
-
-    async def set_entry_delay(service: ServiceCall) -> None:
-        entity = cast(HubitatSecurityKeypad, get_entity(service))
-        delay = cast(int, service.data.get(ATTR_LENGTH))
-        await entity.set_entry_delay(delay)
-
-    async def set_exit_delay(service: ServiceCall) -> None:
-        entity = cast(HubitatSecurityKeypad, get_entity(service))
-        delay = cast(int, service.data.get(ATTR_LENGTH))
-        await entity.set_exit_delay(delay)
-
-    def get_target_hubs(service: ServiceCall):
-        """
-        Return the target hubs for a service call.
-
-        If ATTR_HUB is specified, return the hub with that ID. Otherwise,
-        return all the hubs.
-        """
-        hubs = []
-        if ATTR_HUB in service.data:
-            hub_id = cast(str, service.data.get(ATTR_HUB)).lower()
-            for hub in hass.data[DOMAIN].values():
-                if hub.id == hub_id:
-                    hubs.append(hub)
-            if len(hubs) == 0:
-                _LOGGER.error("Could not find a hub with ID %s", hub_id)
-        else:
-            hubs = cast(list[Hub], hass.data[DOMAIN].values())
-
-        return hubs
-
-    async def set_hsm(service: ServiceCall) -> None:
-        command = cast(str, service.data.get(ATTR_COMMAND))
-        for hub in get_target_hubs(service):
-            await hub.set_hsm(command)
-
-    async def set_hub_mode(service: ServiceCall) -> None:
-        mode = cast(str, service.data.get(ATTR_MODE))
-        for hub in get_target_hubs(service):
-            await hub.set_mode(mode)
-
-    hass.services.async_register(
-        DOMAIN, ServiceName.CLEAR_CODE, clear_code, schema=CLEAR_CODE_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN,
-        ServiceName.GET_CODES,
-        get_codes,
-        schema=GET_CODES_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN, ServiceName.SEND_COMMAND, send_command, schema=SEND_COMMAND_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, ServiceName.SET_CODE, set_code, schema=SET_CODE_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN,
-        ServiceName.SET_CODE_LENGTH,
-        set_code_length,
-        schema=SET_CODE_LENGTH_SCHEMA,
-    )
-    hass.services.async_register(
-        DOMAIN, ServiceName.SET_ENTRY_DELAY, set_entry_delay, schema=SET_DELAY_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, ServiceName.SET_EXIT_DELAY, set_exit_delay, schema=SET_DELAY_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, ServiceName.SET_HSM, set_hsm, schema=SET_HSM_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, ServiceName.SET_HUB_MODE, set_hub_mode, schema=SET_HUB_MODE_SCHEMA
-    )
+    # The services look up their targets across all hubs, so they only need to
+    # be registered by the first config entry
+    if hass.services.has_service(DOMAIN, ServiceName.CLEAR_CODE):
+        return
+
+    # Hubs add and remove themselves from this dict as entries load and unload
+    all_hubs = cast(dict[str, Hub], hass.data[DOMAIN])
+
+    for name, (schema, handler, supports_response) in _SERVICES.items():
+        hass.services.async_register(
+            DOMAIN,
+            name,
+            partial(handler, all_hubs),
+            schema=schema,
+            supports_response=supports_response,
+        )
 
 
 def async_remove_services(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    hass.services.async_remove(DOMAIN, ServiceName.CLEAR_CODE)
-    hass.services.async_remove(DOMAIN, ServiceName.SET_CODE)
-    hass.services.async_remove(DOMAIN, ServiceName.SET_CODE_LENGTH)
-    hass.services.async_remove(DOMAIN, ServiceName.SET_ENTRY_DELAY)
-    hass.services.async_remove(DOMAIN, ServiceName.SET_EXIT_DELAY)
-    hass.services.async_remove(DOMAIN, ServiceName.SEND_COMMAND)
-    hass.services.async_remove(DOMAIN, ServiceName.SET_HSM)
-    hass.services.async_remove(DOMAIN, ServiceName.SET_HUB_MODE)
+    for name in _SERVICES:
+        hass.services.async_remove(DOMAIN, name)
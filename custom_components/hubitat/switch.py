@@ -3,7 +3,7 @@
 import re
 from enum import StrEnum
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, Unpack, override
+from typing import TYPE_CHECKING, Any, Unpack, cast, override
 
 import voluptuous as vol
 
@@ -17,14 +17,27 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, ICON_ALARM, ServiceName
 from .device import HubitatEntity, HubitatEntityArgs
-from .entities import create_and_add_entities, create_and_add_event_emitters
+from .entities import create_and_add_entities_by_type, create_and_add_event_emitters
 from .fan import is_fan
+from .hub import get_hub
 from .hubitatmaker import Device, DeviceCapability, DeviceCommand
 from .light import is_light
 
 _LOGGER = getLogger(__name__)
 
-_NAME_TEST = re.compile(r"\bswitch\b", re.IGNORECASE)
+# Matched against lowercased labels
+_NAME_TEST = re.compile(r"\bswitch\b")
+
+_device_attrs = (DeviceAttribute.SWITCH, DeviceAttribute.POWER)
+
+_BUTTON_CAPABILITIES = frozenset(
+    {
+        DeviceCapability.PUSHABLE_BUTTON,
+        DeviceCapability.HOLDABLE_BUTTON,
+        DeviceCapability.DOUBLE_TAPABLE_BUTTON,
+        DeviceCapability.RELEASABLE_BUTTON,
+    }
+)
 
 ENTITY_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id})
 
@@ -46,9 +59,12 @@ class HubitatSwitch(HubitatEntity, SwitchEntity):
         """Initialize a Hubitat switch."""
         HubitatEntity.__init__(self, **kwargs)
         SwitchEntity.__init__(self)
+        # Most labels don't mention "switch" at all, so only run the
+        # word-boundary regex on the ones that do
+        label = self._device.label.lower()
         self._attr_device_class: SwitchDeviceClass = (  # pyright: ignore[reportIncompatibleVariableOverride]
             SwitchDeviceClass.SWITCH
-            if _NAME_TEST.search(self._device.label)
+            if "switch" in label and _NAME_TEST.search(label)
             else SwitchDeviceClass.OUTLET
         )
         self._attr_unique_id: str | None = f"{super().unique_id}::switch"
@@ -69,19 +85,19 @@ class HubitatSwitch(HubitatEntity, SwitchEntity):
     @override
     def device_attrs(self) -> tuple[DeviceAttribute, ...] | None:
         """Return this entity's associated attributes"""
-        return (DeviceAttribute.SWITCH, DeviceAttribute.POWER)
+        return _device_attrs
 
     @override
     async def async_turn_on(self, **kwargs: Any) -> None:  # pyright: ignore[reportAny]
         """Turn on the switch."""
-        _LOGGER.debug(f"Turning on {self.name} with {kwargs}")
+        _LOGGER.debug("Turning on %s with %s", self.name, kwargs)
         await self.send_command(DeviceCommand.ON)
 
     @override
     async def async_turn_off(self, **kwargs: Any) -> None:  # pyright: ignore[reportAny]
         """Turn off the switch."""
-        _LOGGER.debug(f"Turning off {self.name}")
-        await self.send_command("off")
+        _LOGGER.debug("Turning off %s", self.name)
+        await self.send_command(DeviceCommand.OFF)
 
 
 class HubitatPowerMeterSwitch(HubitatSwitch):
@@ -99,7 +115,7 @@ class HubitatAlarm(HubitatSwitch):
     def __init__(self, **kwargs: Unpack[HubitatEntityArgs]):
         """Initialize a Hubitat alarm."""
         super().__init__(type=SwitchType.ALARM, **kwargs)
-        self._attr_name: str | None = f"{super(HubitatEntity, self).name} Alarm".title()
+        self._attr_name: str | None = f"{self._device.label} Alarm".title()
         self._attr_icon: str | None = ICON_ALARM
 
     @override
@@ -143,20 +159,22 @@ def is_alarm(device: Device, _overrides: dict[str, str] | None = None) -> bool:
 
 def is_button_controller(device: Device) -> bool:
     """Return true if the device is a stateless button controller."""
-    return (
-        DeviceCapability.PUSHABLE_BUTTON in device.capabilities
-        or DeviceCapability.HOLDABLE_BUTTON in device.capabilities
-        or DeviceCapability.DOUBLE_TAPABLE_BUTTON in device.capabilities
-        or DeviceCapability.RELEASABLE_BUTTON in device.capabilities
-    )
-
+    return not _BUTTON_CAPABILITIES.isdisjoint(device.capabilities)
 
-def is_simple_switch(device: Device, overrides: dict[str, str] | None = None) -> bool:
-    return is_switch(device, overrides) and not is_energy_meter(device, overrides)
 
-
-def is_smart_switch(device: Device, overrides: dict[str, str] | None = None) -> bool:
-    return is_switch(device, overrides) and is_energy_meter(device, overrides)
+def get_switch_types(
+    device: Device, overrides: dict[str, str] | None = None
+) -> list[type[HubitatSwitch]]:
+    """Return the switch entity classes a device should be represented by."""
+    types: list[type[HubitatSwitch]] = []
+    if is_switch(device, overrides):
+        if is_energy_meter(device, overrides):
+            types.append(HubitatPowerMeterSwitch)
+        else:
+            types.append(HubitatSwitch)
+    if is_alarm(device, overrides):
+        types.append(HubitatAlarm)
+    return types
 
 
 async def async_setup_entry(
@@ -166,37 +184,20 @@ async def async_setup_entry(
 ) -> None:
     """Initialize switch devices."""
 
-    _ = create_and_add_entities(
-        hass,
-        config_entry,
-        async_add_entities,
-        "switch",
-        HubitatSwitch,
-        is_simple_switch,
-    )
-
-    _ = create_and_add_entities(
-        hass,
-        config_entry,
-        async_add_entities,
-        "switch",
-        HubitatPowerMeterSwitch,
-        is_smart_switch,
+    switches = create_and_add_entities_by_type(
+        hass, config_entry, async_add_entities, "switch", get_switch_types
     )
 
     _ = create_and_add_event_emitters(hass, config_entry, is_button_controller)
 
-    alarms = create_and_add_entities(
-        hass, config_entry, async_add_entities, "switch", HubitatAlarm, is_alarm
-    )
-
-    if len(alarms) > 0:
+    if any(isinstance(switch, HubitatAlarm) for switch in switches):
+        hub = get_hub(hass, config_entry.entry_id)
 
         def get_entity(service: ServiceCall) -> HubitatAlarm | None:
-            entity_id = service.data.get(ATTR_ENTITY_ID)
-            for alarm in alarms:
-                if alarm.entity_id == entity_id:
-                    return alarm
+            entity_id = cast(str, service.data.get(ATTR_ENTITY_ID))
+            alarm = hub.get_entity(entity_id)
+            if isinstance(alarm, HubitatAlarm):
+                return alarm
             _LOGGER.warning("No alarm for ID %s", entity_id)
             return None
 
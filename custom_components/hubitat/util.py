@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from hashlib import sha256
 
 from homeassistant.config_entries import ConfigEntry
@@ -9,15 +10,15 @@ from .error import DeviceError
 from .hubitatmaker.types import Device
 from .types import HasToken
 
-_token_hashes: dict[str, str] = {}
+# Splits a camelCase identifier into words
+_CAMEL_SPLIT = re.compile(r".+?(?:(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|$)")
 
 
+@lru_cache(maxsize=16)
 def get_token_hash(token: str) -> str:
-    if token not in _token_hashes:
-        hasher = sha256()
-        hasher.update(token.encode("utf-8"))
-        _token_hashes[token] = hasher.hexdigest()
-    return _token_hashes[token]
+    hasher = sha256()
+    hasher.update(token.encode("utf-8"))
+    return hasher.hexdigest()
 
 
 def get_hub_short_id(hub: HasToken) -> str:
@@ -35,27 +36,23 @@ def get_hub_device_id(hub: HasToken, device: str | Device) -> str:
 
 
 def get_hubitat_device_id(device: DeviceEntry) -> str:
-    for id_set in device.identifiers:
-        if id_set[0] == DOMAIN:
-            # The second identifier is hub_id:device_id
-            if ":" in id_set[1]:
-                return id_set[1].split(":")[1]
-            return id_set[1]
-    raise DeviceError(f"No Hubitat entry for device {device.id}")
+    identifier = next(
+        (id_set[1] for id_set in device.identifiers if id_set[0] == DOMAIN), None
+    )
+    if identifier is None:
+        raise DeviceError(f"No Hubitat entry for device {device.id}")
 
+    # The identifier is hub_id:device_id, or just device_id for the hub itself
+    hub_id, sep, device_id = identifier.partition(":")
+    return device_id if sep else hub_id
 
+
+@lru_cache(maxsize=256)
 def to_display_name(identifier: str) -> str:
-    try:
-        if "_" in identifier:
-            parts = identifier.split("_")
-        else:
-            matches = re.finditer(
-                ".+?(?:(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|$)", identifier
-            )
-            parts = [m.group(0) for m in matches]
-        return " ".join(parts).capitalize()
-    except Exception:
-        return identifier
+    if "_" in identifier:
+        return identifier.replace("_", " ").capitalize()
+    parts = [m.group(0) for m in _CAMEL_SPLIT.finditer(identifier)]
+    return " ".join(parts).capitalize()
 
 
 def get_device_identifiers(hub_id: str, device_id: str) -> set[tuple[str, str]]:
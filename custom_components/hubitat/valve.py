@@ -22,6 +22,8 @@ _LOGGER = getLogger(__name__)
 
 _NAME_TEST = re.compile(r"\bgas\b", re.IGNORECASE)
 
+_device_attrs = (DeviceAttribute.VALVE,)
+
 
 class HubitatValve(HubitatEntity, ValveEntity):  # pyright: ignore[reportIncompatibleVariableOverride]
     """Representation of a Hubitat switch."""
@@ -64,7 +66,7 @@ class HubitatValve(HubitatEntity, ValveEntity):  # pyright: ignore[reportIncompa
     @override
     def device_attrs(self) -> tuple[DeviceAttribute, ...] | None:
         """Return this entity's associated attributes"""
-        return (DeviceAttribute.VALVE,)
+        return _device_attrs
 
     @override
     async def async_open_valve(self) -> None:
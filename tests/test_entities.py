@@ -5,6 +5,7 @@ import pytest
 
 from custom_components.hubitat.device import Hub
 from custom_components.hubitat.hubitatmaker import Device
+from custom_components.hubitat.hubitatmaker.types import Attribute
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_registry import EntityRegistry
@@ -17,6 +18,13 @@ def mock_get_reg(_: HomeAssistant) -> EntityRegistry:
     return mock_reg
 
 
+def create_attributes(**values: str) -> Dict[str, Attribute]:
+    return {
+        name: Attribute({"name": name, "currentValue": value})
+        for name, value in values.items()
+    }
+
+
 @patch("custom_components.hubitat.entities.get_hub")
 @patch(
     "custom_components.hubitat.entities.entity_registry.async_get",
@@ -24,8 +32,12 @@ def mock_get_reg(_: HomeAssistant) -> EntityRegistry:
 )
 @pytest.mark.asyncio
 async def test_entity_migration(get_hub: Mock) -> None:
-    mock_device_1 = NonCallableMock(type="switch", attributes=["state"], label="Switch")
-    mock_device_2 = NonCallableMock(type="fan", attributes=["state"], label="Fan")
+    mock_device_1 = NonCallableMock(
+        type="switch", attributes=create_attributes(switch="on"), label="Switch"
+    )
+    mock_device_2 = NonCallableMock(
+        type="fan", attributes=create_attributes(switch="off"), label="Fan"
+    )
     MockHub = Mock(spec=Hub)
     mock_hub = MockHub()
     mock_hub.configure_mock(
@@ -91,3 +103,89 @@ async def test_add_event_emitters(HubitatEventEmitter: Mock, get_hub: Mock) -> N
     assert (
         mock_hub.add_event_emitters.call_count == 1
     ), "event emitters should have been added to hub"
+
+
+@patch("custom_components.hubitat.entities.get_hub")
+@patch("custom_components.hubitat.entities.entity_registry.async_get")
+@pytest.mark.asyncio
+async def test_create_entities_by_type(get_reg: Mock, get_hub: Mock) -> None:
+    from custom_components.hubitat.const import H_CONF_DEVICE_TYPE_OVERRIDES
+    from custom_components.hubitat.entities import create_and_add_entities_by_type
+
+    class FakeEntity:
+        temp_devices: list[str] = []
+        kind = ""
+
+        def __init__(self, hub: Hub, device: Device, temp: bool = False) -> None:
+            self.device = device
+            self.unique_id = f"{device.id}::{self.kind}"
+            if temp:
+                self.temp_devices.append(device.id)
+
+    class FakeSwitch(FakeEntity):
+        kind = "switch"
+
+    class FakeLight(FakeEntity):
+        kind = "light"
+
+    class FakeAlarm(FakeEntity):
+        kind = "alarm"
+
+    mock_device_1 = NonCallableMock(id="id1", type="switch")
+    mock_device_2 = NonCallableMock(id="id2", type="alarm")
+    mock_device_3 = NonCallableMock(id="id3", type="switch")
+    MockHub = Mock(spec=Hub)
+    mock_hub = MockHub()
+    mock_hub.devices = {
+        "id1": mock_device_1,
+        "id2": mock_device_2,
+        "id3": mock_device_3,
+    }
+    get_hub.return_value = mock_hub
+
+    mock_reg = Mock(spec=EntityRegistry)
+    mock_reg.configure_mock(
+        entities={
+            "switch.one": Mock(unique_id="id1::switch"),
+            "switch.two": Mock(unique_id="id2::switch"),
+            "switch.two_alarm": Mock(unique_id="id2::alarm"),
+            "switch.three": Mock(unique_id="id3::switch"),
+        }
+    )
+    get_reg.return_value = mock_reg
+
+    mock_hass = Mock(spec=["async_create_task"])
+    MockConfigEntry = Mock(spec=ConfigEntry)
+    mock_entry = MockConfigEntry()
+    mock_entry.configure_mock(options={H_CONF_DEVICE_TYPE_OVERRIDES: {"id3": "light"}})
+
+    def get_types(device: Device, overrides: Optional[Dict[str, str]] = None):
+        if overrides and device.id in overrides:
+            return [FakeLight]
+        if device.type == "alarm":
+            return [FakeSwitch, FakeAlarm]
+        return [FakeSwitch]
+
+    mock_async_add_entities = Mock()
+
+    entities = create_and_add_entities_by_type(
+        mock_hass,
+        mock_entry,
+        mock_async_add_entities,
+        "switch",
+        get_types,
+    )
+
+    assert [(type(e), e.device) for e in entities] == [
+        (FakeSwitch, mock_device_1),
+        (FakeSwitch, mock_device_2),
+        (FakeAlarm, mock_device_2),
+        (FakeLight, mock_device_3),
+    ]
+    mock_hub.add_entities.assert_called_once_with(entities)
+    mock_async_add_entities.assert_called_once_with(entities)
+
+    # Only the overridden device builds temporary entities for its defaults
+    assert FakeEntity.temp_devices == ["id3"]
+
+    mock_reg.async_remove.assert_called_once_with("switch.three")
@@ -0,0 +1,51 @@
+from unittest.mock import Mock
+
+from custom_components.hubitat.const import H_CONF_APP_ID
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ACCESS_TOKEN, CONF_HOST
+
+
+def create_hub():
+    from custom_components.hubitat.hub import Hub
+
+    MockConfigEntry = Mock(spec=ConfigEntry)
+    mock_entry = MockConfigEntry()
+    mock_entry.configure_mock(
+        data={CONF_HOST: "10.0.0.1", H_CONF_APP_ID: "1", CONF_ACCESS_TOKEN: "abc"},
+        options={},
+    )
+
+    return Hub(Mock(), mock_entry, 1, Mock(), Mock())
+
+
+def test_get_entity() -> None:
+    hub = create_hub()
+    entity_1 = Mock(entity_id="switch.one", device_id="1")
+    entity_2 = Mock(entity_id="switch.two", device_id="2")
+    hub.add_entities([entity_1, entity_2])
+
+    assert hub.get_entity("switch.one") is entity_1
+    assert hub.get_entity("switch.two") is entity_2
+
+
+def test_get_entity_after_rename() -> None:
+    hub = create_hub()
+    entity = Mock(entity_id="switch.one", device_id="1")
+    hub.add_entities([entity])
+    assert hub.get_entity("switch.one") is entity
+
+    entity.entity_id = "switch.renamed"
+
+    # The stale index entry shouldn't be returned for the old ID
+    assert hub.find_entity("switch.one") is None
+    assert hub.find_entity("switch.renamed") is None
+    assert hub.get_entity("switch.renamed") is entity
+    assert hub.get_entity("switch.one") is None
+
+
+def test_get_unknown_entity() -> None:
+    hub = create_hub()
+    hub.add_entities([Mock(entity_id="switch.one", device_id="1")])
+
+    assert hub.get_entity("switch.unknown") is None
+    assert hub.find_entity("switch.unknown") is None
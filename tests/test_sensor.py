@@ -0,0 +1,244 @@
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.hubitat.hubitatmaker.const import DeviceAttribute
+from custom_components.hubitat.hubitatmaker.types import Attribute
+from homeassistant.const import UnitOfPressure, UnitOfTemperature
+
+
+def create_device(attribute: DeviceAttribute, value: str, unit: str | None = None):
+    device = Mock()
+    device.configure_mock(
+        id="123",
+        label="Test Device",
+        attributes={
+            attribute: Attribute(
+                {
+                    "name": attribute,
+                    "dataType": "NUMBER",
+                    "currentValue": value,
+                    "unit": unit,
+                }
+            )
+        },
+    )
+    return device
+
+
+def test_sensor_name() -> None:
+    hub = Mock()
+    hub.configure_mock(token="abc1235Qbxyz")
+    device = create_device(DeviceAttribute.HUMIDITY, "45")
+
+    from custom_components.hubitat.sensor import HubitatSensor
+
+    sensor = HubitatSensor(hub=hub, device=device, attribute=DeviceAttribute.HUMIDITY)
+    assert sensor.name == "Test Device Humidity"
+    assert sensor.native_value == "45"
+
+
+def test_battery_value() -> None:
+    hub = Mock()
+    hub.configure_mock(token="abc1235Qbxyz")
+
+    from custom_components.hubitat.sensor import HubitatBatterySensor
+
+    device = create_device(DeviceAttribute.BATTERY, "75")
+    sensor = HubitatBatterySensor(
+        hub=hub, device=device, attribute=DeviceAttribute.BATTERY
+    )
+    assert sensor.native_value == 75.0
+
+    # Some devices report battery levels like "Battery 50%"
+    device = create_device(DeviceAttribute.BATTERY, "Battery 50%")
+    sensor = HubitatBatterySensor(
+        hub=hub, device=device, attribute=DeviceAttribute.BATTERY
+    )
+    assert sensor.native_value == 50.0
+
+
+def test_sensor_units() -> None:
+    hub = Mock()
+    hub.configure_mock(token="abc1235Qbxyz")
+
+    from custom_components.hubitat.sensor import (
+        HubitatPressureSensor,
+        HubitatTemperatureSensor,
+    )
+
+    device = create_device(DeviceAttribute.TEMPERATURE, "72", "°F")
+    sensor = HubitatTemperatureSensor(
+        hub=hub, device=device, attribute=DeviceAttribute.TEMPERATURE
+    )
+    assert sensor.native_unit_of_measurement == UnitOfTemperature.FAHRENHEIT
+
+    device = create_device(DeviceAttribute.PRESSURE, "29.9", "inHg")
+    sensor = HubitatPressureSensor(
+        hub=hub, device=device, attribute=DeviceAttribute.PRESSURE
+    )
+    assert sensor.native_unit_of_measurement == UnitOfPressure.INHG
+
+    device = create_device(DeviceAttribute.PRESSURE, "1013")
+    sensor = HubitatPressureSensor(
+        hub=hub, device=device, attribute=DeviceAttribute.PRESSURE
+    )
+    assert sensor.native_unit_of_measurement == UnitOfPressure.MBAR
+
+
+def test_unchanged_event_skips_update() -> None:
+    hub = Mock()
+    hub.configure_mock(token="abc1235Qbxyz")
+    device = create_device(DeviceAttribute.HUMIDITY, "45")
+
+    from custom_components.hubitat.sensor import HubitatSensor
+
+    sensor = HubitatSensor(hub=hub, device=device, attribute=DeviceAttribute.HUMIDITY)
+
+    with patch.object(sensor, "async_schedule_update_ha_state") as update:
+        # An event for another attribute doesn't change this sensor's state
+        sensor.handle_event(Mock())
+        update.assert_not_called()
+
+        device.attributes[DeviceAttribute.HUMIDITY] = Attribute(
+            {
+                "name": DeviceAttribute.HUMIDITY,
+                "dataType": "NUMBER",
+                "currentValue": "50",
+                "unit": None,
+            }
+        )
+        sensor.handle_event(Mock())
+        update.assert_called_once()
+        assert sensor.native_value == "50"
+
+
+def create_registry(disabled_ids: set[str]):
+    ereg = Mock()
+    ereg.async_get_entity_id.side_effect = lambda _platform, _domain, unique_id: (
+        f"sensor.{unique_id}" if unique_id in disabled_ids else None
+    )
+    ereg.async_get.return_value = Mock(disabled=True)
+    return ereg
+
+
+def test_disabled_hub_sensors_are_skipped() -> None:
+    hub = Mock()
+    hub.configure_mock(
+        token="abc1235Qbxyz",
+        hsm_supported=True,
+        mode_supported=True,
+        device=create_device(DeviceAttribute.MODE, "Day"),
+    )
+
+    from custom_components.hubitat.sensor import (
+        HubitatHsmSensor,
+        HubitatHubModeSensor,
+        create_hub_entities,
+    )
+
+    # No registry entries, so both sensors are created
+    entities = create_hub_entities(hub, create_registry(set()))
+    assert [type(e) for e in entities] == [HubitatHsmSensor, HubitatHubModeSensor]
+
+    # A sensor that's disabled in the registry isn't created
+    hsm_id = entities[0].unique_id
+    entities = create_hub_entities(hub, create_registry({hsm_id}))
+    assert [type(e) for e in entities] == [HubitatHubModeSensor]
+
+
+def create_multi_device(values: dict[str, str]):
+    device = Mock()
+    device.configure_mock(
+        id="123",
+        label="Test Device",
+        capabilities=frozenset(),
+        attributes={
+            name: Attribute({"name": name, "dataType": "STRING", "currentValue": value})
+            for name, value in values.items()
+        },
+    )
+    return device
+
+
+async def setup_sensors(hub: Mock, ereg: Mock) -> list[Any]:
+    from custom_components.hubitat.sensor import async_setup_entry
+
+    add_entities = Mock()
+    with (
+        patch("custom_components.hubitat.sensor.get_hub", return_value=hub),
+        patch(
+            "custom_components.hubitat.sensor.entity_registry.async_get",
+            return_value=ereg,
+        ),
+    ):
+        await async_setup_entry(Mock(), Mock(), add_entities)
+
+    if add_entities.call_count == 0:
+        return []
+    add_entities.assert_called_once()
+    return add_entities.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_disabled_update_sensor_is_skipped() -> None:
+    device = create_multi_device({DeviceAttribute.LAST_UPDATE: "2024-01-01"})
+    hub = Mock()
+    hub.configure_mock(
+        token="abc1235Qbxyz",
+        hsm_supported=False,
+        mode_supported=False,
+        devices={device.id: device},
+    )
+    hub.get_device_entities.return_value = ()
+
+    from custom_components.hubitat.sensor import HubitatUpdateSensor
+
+    sensors = await setup_sensors(hub, create_registry(set()))
+    assert [type(s) for s in sensors] == [HubitatUpdateSensor]
+
+    update_id = sensors[0].unique_id
+    sensors = await setup_sensors(hub, create_registry({update_id}))
+    assert sensors == []
+
+
+@pytest.mark.asyncio
+async def test_setup_entry() -> None:
+    device = create_multi_device(
+        {
+            DeviceAttribute.SWITCH: "on",
+            DeviceAttribute.HUMIDITY: "45",
+            DeviceAttribute.LAST_UPDATE: "2024-01-01",
+            "fooBar": "baz",
+        }
+    )
+    switch = Mock(device_attrs=(DeviceAttribute.SWITCH, DeviceAttribute.POWER))
+    hub = Mock()
+    hub.configure_mock(
+        token="abc1235Qbxyz",
+        hsm_supported=False,
+        mode_supported=False,
+        devices={device.id: device},
+    )
+    hub.get_device_entities.return_value = (switch,)
+
+    from custom_components.hubitat.sensor import HubitatSensor, HubitatUpdateSensor
+
+    sensors = await setup_sensors(hub, create_registry(set()))
+    hub.get_device_entities.assert_called_with(device.id)
+    hub.add_entities.assert_called_once_with(sensors)
+
+    # The update sensor comes first, and the switch attribute claimed by
+    # another platform's entity doesn't get a sensor
+    assert [(type(s), s.device_attrs) for s in sensors] == [
+        (HubitatUpdateSensor, (DeviceAttribute.LAST_UPDATE,)),
+        (HubitatSensor, (DeviceAttribute.HUMIDITY,)),
+        (HubitatSensor, ("fooBar",)),
+    ]
+
+    # Known sensor attributes are enabled by default; unknown attributes get
+    # disabled generic sensors
+    assert sensors[1].entity_registry_enabled_default
+    assert not sensors[2].entity_registry_enabled_default
+    assert sensors[2].name == "Test Device Foo Bar"
@@ -0,0 +1,111 @@
+from typing import Any, Callable
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.hubitat.const import ATTR_DELAY, DOMAIN, ServiceName
+from homeassistant.const import ATTR_ENTITY_ID
+
+
+def create_hass(hubs: dict[str, Any]) -> Mock:
+    hass = Mock()
+    hass.data = {DOMAIN: hubs}
+    hass.services.has_service.return_value = False
+    return hass
+
+
+def get_handler(hass: Mock, name: ServiceName) -> Callable[..., Any]:
+    for call in hass.services.async_register.call_args_list:
+        if call.args[1] == name:
+            return call.args[2]
+    raise KeyError(name)
+
+
+def create_keypad_hub() -> Mock:
+    hub = Mock()
+    hub.configure_mock(token="abc1235Qbxyz", send_command=AsyncMock())
+
+    device = Mock()
+    device.configure_mock(
+        id="12",
+        label="Keypad",
+        attributes={},
+        commands=[],
+        capabilities=frozenset(),
+    )
+
+    from custom_components.hubitat.alarm_control_panel import HubitatSecurityKeypad
+
+    keypad = HubitatSecurityKeypad(hub=hub, device=device)
+    hub.find_entity.return_value = keypad
+    return hub
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service,command",
+    [
+        (ServiceName.SET_ENTRY_DELAY, "setEntryDelay"),
+        (ServiceName.SET_EXIT_DELAY, "setExitDelay"),
+    ],
+)
+async def test_set_delay(service: ServiceName, command: str) -> None:
+    from custom_components.hubitat.services import async_register_services
+
+    hub = create_keypad_hub()
+    hass = create_hass({"entry1": hub})
+    async_register_services(hass, Mock())
+
+    handler = get_handler(hass, service)
+    await handler(
+        Mock(data={ATTR_ENTITY_ID: "alarm_control_panel.keypad", ATTR_DELAY: 30})
+    )
+
+    hub.send_command.assert_awaited_once_with("12", command, "30")
+
+
+class FakeServices:
+    def __init__(self) -> None:
+        self.services: dict[tuple[str, str], Any] = {}
+        self.register_count = 0
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return (domain, service) in self.services
+
+    def async_register(self, domain: str, service: str, handler: Any, **_: Any):
+        self.register_count += 1
+        self.services[(domain, service)] = handler
+
+    def async_remove(self, domain: str, service: str) -> None:
+        del self.services[(domain, service)]
+
+
+@pytest.mark.asyncio
+async def test_services_shared_by_entries() -> None:
+    from custom_components.hubitat import async_unload_entry
+    from custom_components.hubitat.services import _SERVICES, async_register_services
+
+    hass = Mock()
+    hass.data = {DOMAIN: {"entry1": Mock(), "entry2": Mock()}}
+    hass.services = FakeServices()
+    hass.config_entries.async_forward_entry_unload = AsyncMock(return_value=True)
+
+    entry1 = Mock(entry_id="entry1")
+    entry2 = Mock(entry_id="entry2")
+
+    # Services are only registered by the first entry
+    async_register_services(hass, entry1)
+    async_register_services(hass, entry2)
+    assert hass.services.register_count == len(_SERVICES)
+    assert set(hass.services.services) == {(DOMAIN, name) for name in _SERVICES}
+
+    hub = Mock(unload=AsyncMock())
+    with patch("custom_components.hubitat.get_hub", return_value=hub):
+        # The services outlive the first entry...
+        assert await async_unload_entry(hass, entry1)
+        assert set(hass.services.services) == {(DOMAIN, name) for name in _SERVICES}
+
+        # ...and are all removed with the last one
+        assert await async_unload_entry(hass, entry2)
+        assert hass.services.services == {}
+        assert not hass.services.has_service(DOMAIN, ServiceName.GET_CODES)
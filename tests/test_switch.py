@@ -1,5 +1,5 @@
 from typing import List
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -8,21 +8,13 @@ from homeassistant.helpers.entity import Entity
 
 
 @pytest.mark.asyncio
-@patch("custom_components.hubitat.switch.create_and_add_entities")
+@patch("custom_components.hubitat.switch.create_and_add_entities_by_type")
 @patch("custom_components.hubitat.switch.create_and_add_event_emitters")
 async def test_setup_entry(create_emitters, create_entities) -> None:
     create_entities.return_value = []
     create_emitters.return_value = None
 
-    from custom_components.hubitat.switch import (
-        HubitatAlarm,
-        HubitatPowerMeterSwitch,
-        HubitatSwitch,
-        async_setup_entry,
-        is_alarm,
-        is_simple_switch,
-        is_smart_switch,
-    )
+    from custom_components.hubitat.switch import async_setup_entry, get_switch_types
 
     mock_hass = Mock(spec=["async_register"])
     mock_config_entry = Mock(spec=ConfigEntry)
@@ -34,33 +26,38 @@ async def test_setup_entry(create_emitters, create_entities) -> None:
 
     await async_setup_entry(mock_hass, mock_config_entry, mock_add_entities)
 
-    assert create_entities.call_count == 3, "expected 3 calls to create entities"
-
-    call1 = call(
+    create_entities.assert_called_once_with(
         mock_hass,
         mock_config_entry,
         mock_add_entities,
         "switch",
-        HubitatSwitch,
-        is_simple_switch,
+        get_switch_types,
     )
-    call2 = call(
-        mock_hass,
-        mock_config_entry,
-        mock_add_entities,
-        "switch",
+
+    assert create_emitters.call_count == 1, "expected 1 call to create emitters"
+
+
+def test_get_switch_types() -> None:
+    from custom_components.hubitat.hubitatmaker import DeviceCapability
+    from custom_components.hubitat.switch import (
+        HubitatAlarm,
         HubitatPowerMeterSwitch,
-        is_smart_switch,
+        HubitatSwitch,
+        get_switch_types,
     )
-    call3 = call(
-        mock_hass,
-        mock_config_entry,
-        mock_add_entities,
-        "switch",
-        HubitatAlarm,
-        is_alarm,
+
+    device = Mock()
+    device.id = "1"
+    device.label = "Outlet"
+    device.capabilities = frozenset({DeviceCapability.SWITCH})
+    assert get_switch_types(device) == [HubitatSwitch]
+
+    device.capabilities = frozenset(
+        {DeviceCapability.SWITCH, DeviceCapability.POWER_METER}
     )
+    assert get_switch_types(device) == [HubitatPowerMeterSwitch]
 
-    create_entities.assert_has_calls([call1, call2, call3])
+    device.capabilities = frozenset({DeviceCapability.SWITCH, DeviceCapability.ALARM})
+    assert get_switch_types(device) == [HubitatSwitch, HubitatAlarm]
 
-    assert create_emitters.call_count == 1, "expected 1 call to create emitters"
+    assert get_switch_types(device, {"1": "light"}) == [HubitatAlarm]